@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Concurrent Load Generator for the Snap/Throw Logging API
+Replays drill reps against a local `next start` server and reports per-route latency
+
+Requires aiohttp (pip install aiohttp). Point the server at a local Supabase stack
+(`supabase start`) so inserts hit a real Postgres without touching production:
+
+    SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_SERVICE_ROLE_KEY=<local key> \\
+        python scripts/api_load.py --start-server --rates 5,10,20,40 --duration 30
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import subprocess
+import urllib.request
+from urllib.parse import urlparse
+import aiohttp
+from playwright_config import get_app_url
+
+CONCEPTS = ['SMASH', 'SAIL', 'MESH', 'STICK', 'DAGGER', 'FOUR_VERTS', 'Y_CROSS', 'SHALLOW',
+            'CURL_FLAT', 'SLANT_FLAT', 'SPACING', 'LEVELS', 'MILLS', 'YANKEE', 'POST_WHEEL',
+            'STICK_NOD', 'TUNNEL_SCREEN', 'GLANCE_RPO', 'BOOT_FLOOD']
+COVERAGES = ['C0', 'C1', 'C2', 'TAMPA2', 'PALMS', 'C3', 'C4', 'QUARTERS', 'C6', 'C9']
+FORMATIONS = ['TRIPS_RIGHT', 'DOUBLES', 'BUNCH_LEFT']
+RECEIVERS = ['X', 'Z', 'SLOT', 'TE', 'RB']
+GRADES = ['Great', 'Good', 'OK', 'Risky', 'Late', 'Missed hot', 'Wrong read']
+THROW_AREAS = [f"{h}_{b}" for h in ('L', 'M', 'R') for b in ('SHORT', 'MID', 'DEEP')]
+
+# Upper bounds (ms) of the latency histogram buckets
+HISTOGRAM_BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf')]
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1', '0.0.0.0')
+
+def get_load_config():
+    """
+    Returns default load profile settings
+    """
+    return {
+        'url': get_app_url(),
+        'rates': [5.0],            # Drill reps started per second, one stage per rate
+        'duration': 30.0,          # Seconds per stage
+        'connections': 50,         # Connection pool size (keep-alive)
+        'users': 30,               # Distinct simulated users (a classroom)
+        'timeout': 30.0,           # Per-request timeout in seconds
+        'summary_every': 5,        # Every Nth rep also asks the assistant for throw metrics
+        'routes': ['snap-log', 'throw-log', 'skills/track', 'metrics/throw-summary'],
+        'seed': 1337,
+        'max_error_rate': 0.01,    # Saturation: more than 1% errors
+        'max_p99_ms': 1000,        # Saturation: p99 above one second
+        'min_throughput_ratio': 0.9,  # Saturation: completing under 90% of offered reps
+    }
+
+def snap_payload(rng, user_id, play_id):
+    coverage = rng.choice(COVERAGES)
+    return {
+        'conceptId': rng.choice(CONCEPTS),
+        'coverage': coverage,
+        'formation': rng.choice(FORMATIONS),
+        'playId': play_id,
+        'rngSeed': rng.randrange(2 ** 31),
+        'c3Rotation': rng.choice(['SKY', 'BUZZ', 'CLOUD_STRONG']) if coverage == 'C3' else None,
+        'press': {
+            'CB_L': {'outcome': rng.choice(['jam', 'whiff', 'none']), 'rid': 'X'},
+            'CB_R': {'outcome': rng.choice(['jam', 'whiff', 'none']), 'rid': 'Z'},
+        },
+        'roles': {'blitzers': rng.sample(['MIKE', 'WILL', 'SAM', 'NB'], rng.randint(0, 2)), 'spy': None},
+        'leverage': {
+            rid: {'side': rng.choice(['inside', 'outside', 'even']), 'via': 'alignment'}
+            for rid in RECEIVERS
+        },
+    }
+
+def throw_payload(rng, user_id, play_id, snap):
+    window = round(rng.random(), 3)
+    held_vs_break = rng.randint(-300, 500)
+    return {
+        'conceptId': snap['conceptId'],
+        'coverage': snap['coverage'],
+        'formation': snap['formation'],
+        'target': rng.choice(RECEIVERS),
+        'time': round(rng.uniform(0.2, 0.9), 3),
+        'playId': play_id,
+        'holdMs': rng.randint(1200, 4200),
+        'throwArea': rng.choice(THROW_AREAS),
+        'depthYds': round(rng.uniform(2, 35), 1),
+        'windowScore': window,
+        'nearestSepYds': round(rng.uniform(0.3, 6.0), 2),
+        'grade': rng.choice(GRADES),
+        'userId': user_id,
+        'extra': {
+            'catchWindowScore': round(min(1.0, window + rng.uniform(-0.2, 0.2)), 3),
+            'catchSepYds': round(rng.uniform(0.3, 6.0), 2),
+            'targetBreakMs': rng.randint(1200, 2600),
+            'heldVsBreakMs': held_vs_break,
+            'firstOpenId': rng.choice(RECEIVERS),
+            'firstOpenMs': rng.randint(900, 2800),
+        },
+    }
+
+def grade_payload(throw):
+    extra = throw['extra']
+    return {
+        'conceptId': throw['conceptId'], 'coverage': throw['coverage'], 'target': throw['target'],
+        'time': throw['time'], 'formation': throw['formation'], 'playId': throw['playId'],
+        'windowScore': throw['windowScore'], 'nearestSepYds': throw['nearestSepYds'],
+        'holdMs': throw['holdMs'], 'throwArea': throw['throwArea'],
+        'catchWindowScore': extra['catchWindowScore'], 'catchSepYds': extra['catchSepYds'],
+        'targetBreakMs': extra['targetBreakMs'], 'heldVsBreakMs': extra['heldVsBreakMs'],
+        'firstOpenId': extra['firstOpenId'], 'firstOpenMs': extra['firstOpenMs'],
+    }
+
+def track_payload(throw):
+    extra = throw['extra']
+    return {
+        'conceptId': throw['conceptId'], 'coverage': throw['coverage'], 'formation': throw['formation'],
+        'throw': {
+            'grade': throw['grade'], 'windowScore': throw['windowScore'],
+            'catchWindowScore': extra['catchWindowScore'], 'heldVsBreakMs': extra['heldVsBreakMs'],
+            'throwArea': throw['throwArea'], 'firstOpenId': extra['firstOpenId'], 'target': throw['target'],
+        },
+    }
+
+def summary_params(throw, user_id):
+    horiz, band = throw['throwArea'].split('_')
+    return {'coverage': throw['coverage'], 'conceptId': throw['conceptId'],
+            'areaHoriz': horiz, 'areaBand': band, 'limit': '20', 'userId': user_id}
+
+def response_error(route, status, body):
+    """
+    Returns an error label for a response, or None if it succeeded.
+    Several routes swallow failures and still answer 200, so the body is checked too.
+    """
+    detail = body.get('error') if isinstance(body, dict) else None
+    if status >= 400:
+        return f"HTTP {status}: {detail}"[:80] if detail else f"HTTP {status}"
+    if not isinstance(body, dict):
+        return None
+    if body.get('ok') is False or 'error' in body:
+        return str(body.get('error') or 'ok=false')[:80]
+    if route == 'football-grade' and str(body.get('rationale', '')).startswith('Grader error'):
+        return body['rationale'][:80]
+    return None
+
+class RouteStats:
+    """
+    Latency samples, status counts and errors for one route
+    """
+
+    def __init__(self, route):
+        self.route = route
+        self.latencies_ms = []
+        self.errors = {}
+        self.requests = 0
+
+    def record(self, latency_ms, error=None):
+        self.requests += 1
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        else:
+            self.latencies_ms.append(latency_ms)
+
+    def percentile(self, pct):
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def histogram(self):
+        counts = [0] * len(HISTOGRAM_BUCKETS)
+        for latency in self.latencies_ms:
+            for i, bound in enumerate(HISTOGRAM_BUCKETS):
+                if latency <= bound:
+                    counts[i] += 1
+                    break
+        return counts
+
+    def summary(self, elapsed):
+        error_count = sum(self.errors.values())
+        return {
+            'route': self.route,
+            'requests': self.requests,
+            'ok': len(self.latencies_ms),
+            'errors': error_count,
+            'error_rate': error_count / self.requests if self.requests else 0.0,
+            'throughput_rps': len(self.latencies_ms) / elapsed if elapsed else 0.0,
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+            'max_ms': max(self.latencies_ms) if self.latencies_ms else None,
+            'histogram': dict(zip([str(b) for b in HISTOGRAM_BUCKETS], self.histogram())),
+            'error_kinds': dict(self.errors),
+        }
+
+async def timed_request(session, stats, route, method, url, **kwargs):
+    started = time.perf_counter()
+    try:
+        async with session.request(method, url, **kwargs) as response:
+            try:
+                body = await response.json(content_type=None)
+            except (ValueError, aiohttp.ContentTypeError):
+                body = None
+            error = response_error(route, response.status, body)
+    except asyncio.TimeoutError:
+        error = 'timeout'
+    except aiohttp.ClientError as e:
+        error = type(e).__name__
+    stats[route].record((time.perf_counter() - started) * 1000, error)
+
+def simulated_user_ids(rng, count):
+    """
+    Returns count stable user ids, uuids like the crypto.randomUUID() ids real clients send
+    """
+    return [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(count)]
+
+async def run_rep(session, stats, config, rng, rep_index, user_ids):
+    """
+    One drill rep: snap, then the throw's grade/log/track calls as the simulator fires them
+    """
+    base = config['url'].rstrip('/')
+    routes = config['routes']
+    user_id = rng.choice(user_ids)
+    headers = {'x-user-id': user_id}
+    play_id = rep_index + 1
+
+    snap = snap_payload(rng, user_id, play_id)
+    throw = throw_payload(rng, user_id, play_id, snap)
+
+    if 'snap-log' in routes:
+        await timed_request(session, stats, 'snap-log', 'POST', f"{base}/api/snap-log", json=snap, headers=headers)
+
+    # The grade request is awaited by the simulator; the other calls fire together afterwards
+    if 'football-grade' in routes:
+        await timed_request(session, stats, 'football-grade', 'POST', f"{base}/api/football-grade",
+                            json=grade_payload(throw))
+
+    follow_ups = []
+    if 'throw-log' in routes:
+        follow_ups.append(timed_request(session, stats, 'throw-log', 'POST', f"{base}/api/throw-log",
+                                        json=throw, headers=headers))
+    if 'skills/track' in routes:
+        follow_ups.append(timed_request(session, stats, 'skills/track', 'POST', f"{base}/api/skills/track",
+                                        json=track_payload(throw), headers=headers))
+    if 'metrics/throw-summary' in routes and rep_index % config['summary_every'] == 0:
+        follow_ups.append(timed_request(session, stats, 'metrics/throw-summary', 'GET',
+                                        f"{base}/api/metrics/throw-summary",
+                                        params=summary_params(throw, user_id)))
+    await asyncio.gather(*follow_ups)
+
+async def run_stage(config, rate, rng, user_ids):
+    """
+    Starts reps at a fixed rate (open loop, so slow responses don't lower the offered load)
+    """
+    stats = {route: RouteStats(route) for route in config['routes']}
+    connector = aiohttp.TCPConnector(limit=config['connections'], keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=config['timeout'])
+    interval = 1.0 / rate
+    total_reps = int(rate * config['duration'])
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        started = time.perf_counter()
+        tasks = []
+        for rep_index in range(total_reps):
+            delay = started + rep_index * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(run_rep(session, stats, config, rng, rep_index, user_ids)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    return {
+        'rate': rate,
+        'reps': total_reps,
+        'elapsed': elapsed,
+        'routes': [s.summary(elapsed) for s in stats.values() if s.requests],
+    }
+
+def saturation_reasons(stage, config):
+    """
+    Returns why a stage counts as saturated (empty when the routes kept up)
+    """
+    reasons = []
+    for route in stage['routes']:
+        if route['error_rate'] > config['max_error_rate']:
+            reasons.append(f"{route['route']}: {route['error_rate']:.1%} errors")
+        if route['p99_ms'] is not None and route['p99_ms'] > config['max_p99_ms']:
+            reasons.append(f"{route['route']}: p99 {route['p99_ms']:.0f}ms")
+    offered = stage['reps'] / config['duration']
+    achieved = stage['reps'] / stage['elapsed'] if stage['elapsed'] else 0.0
+    if achieved < offered * config['min_throughput_ratio']:
+        reasons.append(f"completed {achieved:.1f} reps/s of {offered:.1f} offered")
+    return reasons
+
+def print_stage(stage, reasons):
+    print(f"\n📊 Stage {stage['rate']:.1f} reps/s — {stage['reps']} reps in {stage['elapsed']:.1f}s")
+    print(f"  {'route':<24}{'reqs':>7}{'rps':>8}{'err%':>7}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}")
+    for route in stage['routes']:
+        fmt = lambda v: f"{v:.0f}" if v is not None else "-"
+        print(f"  {route['route']:<24}{route['requests']:>7}{route['throughput_rps']:>8.1f}"
+              f"{route['error_rate'] * 100:>7.1f}{fmt(route['p50_ms']):>8}{fmt(route['p90_ms']):>8}"
+              f"{fmt(route['p99_ms']):>8}{fmt(route['max_ms']):>8}")
+    for route in stage['routes']:
+        buckets = ' '.join(f"≤{b}:{c}" for b, c in route['histogram'].items() if c)
+        if buckets:
+            print(f"  {route['route']:<24}{buckets.replace('≤inf', '>5000')}")
+        for kind, count in route['error_kinds'].items():
+            print(f"    ⚠️ {count}x {kind}")
+    if reasons:
+        print("  🔥 Saturated: " + "; ".join(reasons))
+    else:
+        print("  ✅ Routes kept up")
+
+def check_local(url, allow_remote=False):
+    host = urlparse(url).hostname
+    if host not in LOCAL_HOSTS and not allow_remote:
+        raise SystemExit(f"❌ Refusing to load-test {host}; use a local server or pass --allow-remote")
+
+def start_server(url, wait=60):
+    """
+    Runs `next start` on the URL's port and waits until it answers
+    """
+    port = str(urlparse(url).port or 3000)
+    supabase_url = os.environ.get('SUPABASE_URL', '')
+    if not supabase_url:
+        print("⚠️ SUPABASE_URL not set; routes will skip their database writes")
+    elif urlparse(supabase_url).hostname not in LOCAL_HOSTS:
+        raise SystemExit("❌ SUPABASE_URL is not local; point it at `supabase start` before load-testing")
+
+    print(f"🚀 Starting next start on port {port}...")
+    server = subprocess.Popen(['npx', 'next', 'start', '-p', port], env=os.environ.copy())
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=2)
+            print("✅ Server ready")
+            return server
+        except Exception:
+            if server.poll() is not None:
+                raise SystemExit("❌ next start exited; run `npm run build` first")
+            time.sleep(1)
+    server.terminate()
+    raise SystemExit("❌ Server did not become ready in time")
+
+def main():
+    config = get_load_config()
+    parser = argparse.ArgumentParser(description="Load-test the snap/throw logging routes")
+    parser.add_argument('--url', default=config['url'])
+    parser.add_argument('--rates', default=','.join(str(r) for r in config['rates']),
+                        help="Comma-separated reps/sec, one stage each (e.g. 5,10,20,40)")
+    parser.add_argument('--duration', type=float, default=config['duration'])
+    parser.add_argument('--connections', type=int, default=config['connections'])
+    parser.add_argument('--users', type=int, default=config['users'])
+    parser.add_argument('--routes', default=','.join(config['routes']))
+    parser.add_argument('--with-grade', action='store_true',
+                        help="Include football-grade (calls OpenAI on every rep)")
+    parser.add_argument('--seed', type=int, default=config['seed'])
+    parser.add_argument('--start-server', action='store_true', help="Run `next start` for the test")
+    parser.add_argument('--allow-remote', action='store_true')
+    parser.add_argument('--json', dest='json_path', help="Write the full report to this file")
+    args = parser.parse_args()
+
+    check_local(args.url, args.allow_remote)
+    config.update({
+        'url': args.url,
+        'rates': [float(r) for r in args.rates.split(',') if r],
+        'duration': args.duration,
+        'connections': args.connections,
+        'users': args.users,
+        'routes': [r.strip() for r in args.routes.split(',') if r.strip()],
+        'seed': args.seed,
+    })
+    if args.with_grade and 'football-grade' not in config['routes']:
+        config['routes'].append('football-grade')
+
+    server = start_server(args.url) if args.start_server else None
+    stages = []
+    try:
+        rng = random.Random(config['seed'])
+        user_ids = simulated_user_ids(rng, config['users'])
+        for rate in config['rates']:
+            print(f"🏈 Replaying {rate:.1f} reps/s for {config['duration']:.0f}s against {config['url']}...")
+            stage = asyncio.run(run_stage(config, rate, rng, user_ids))
+            reasons = saturation_reasons(stage, config)
+            stage['saturated'] = reasons
+            stages.append(stage)
+            print_stage(stage, reasons)
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+            print("🧹 Server stopped")
+
+    saturated = [s for s in stages if s['saturated']]
+    if saturated:
+        print(f"\n🔥 Saturation starts at {saturated[0]['rate']:.1f} reps/s")
+    else:
+        print("\n✅ No saturation up to the highest rate tested")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'config': config, 'stages': stages}, f, indent=2)
+        print(f"💾 Report saved: {args.json_path}")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("🛑 Load test interrupted by user")
+        sys.exit(1)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Pre-Warmed Page Pool for Playwright
+Keeps pages parked at the Play Simulator pre-snap state so tests skip setup
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from playwright_config import get_app_url, get_context_config, get_page_config
+
+PANEL_SELECTORS = [
+    "button:has-text('Football Playbook Coach')",
+    "button:has-text('Read plays vs coverages with QB-level tips')",
+    "button[aria-controls='football-panel']",
+    ".tab-card:has-text('Football')"
+]
+POCKET_CHECKBOX_SELECTOR = "label:has-text('Pocket Envelope') input[type='checkbox']"
+FIELD_SELECTOR = "svg[data-testid='field-root']"
+
+# PlaySimulator only draws the receivers' openness markers while phase === 'post'
+PRE_SNAP_SCRIPT = """
+() => {
+    const field = document.querySelector("svg[data-testid='field-root']");
+    if (!field || field.getClientRects().length === 0) return false;
+    return !Array.from(field.querySelectorAll('title')).some(t => t.textContent.startsWith('Openness:'));
+}
+"""
+
+# Fires the simulator's own startSnap() (the chat-bar and panel Snap buttons only flip the phase)
+# and returns the snap instant
+START_SNAP_SCRIPT = """
+() => {
+    window.dispatchEvent(new CustomEvent('start-snap'));
+    return performance.now();
+}
+"""
+
+# Dispatches the simulator's hard-reset event and resolves once React has applied it
+# (hardReset() batches its state updates inside a requestAnimationFrame)
+HARD_RESET_SCRIPT = """
+() => new Promise(resolve => {
+    window.dispatchEvent(new CustomEvent('hard-reset'));
+    requestAnimationFrame(() => requestAnimationFrame(() => resolve(true)));
+})
+"""
+
+def find_first(page, selectors, timeout=5000):
+    """
+    Returns the first visible locator among selectors, or None
+    """
+    for selector in selectors:
+        try:
+            locator = page.locator(selector).first
+            locator.wait_for(state='visible', timeout=timeout)
+            return locator
+        except Exception:
+            continue
+    return None
+
+def wait_for_app(page):
+    try:
+        page.wait_for_load_state('networkidle', timeout=30000)
+    except Exception:
+        page.wait_for_load_state('domcontentloaded', timeout=15000)
+
+def open_coach_panel(page):
+    panel_button = find_first(page, PANEL_SELECTORS)
+    if not panel_button:
+        raise Exception("Could not find Football Playbook Coach button")
+    panel_button.click()
+
+def open_play_simulator(page):
+    """
+    Navigates Football Panel -> Play Simulator for layouts that put the simulator behind tabs
+    """
+    # The current panel renders the simulator directly, so skip tab lookups once the field is up
+    try:
+        page.locator(FIELD_SELECTOR).first.wait_for(state='visible', timeout=5000)
+        return
+    except Exception:
+        pass
+    for text in ("Football Panel", "Play Simulator"):
+        tab = page.locator(f"text={text}")
+        if tab.count():
+            tab.first.click()
+            page.wait_for_timeout(300)
+
+def set_pocket_envelope(page, enabled=True):
+    checkbox = page.locator(POCKET_CHECKBOX_SELECTOR).first
+    checkbox.wait_for(state='visible', timeout=10000)
+    checkbox.set_checked(enabled)
+
+def is_pre_snap(page):
+    try:
+        return page.evaluate(PRE_SNAP_SCRIPT)
+    except Exception:
+        return False
+
+def wait_for_pre_snap(page, timeout=10000):
+    page.wait_for_function(PRE_SNAP_SCRIPT, timeout=timeout)
+
+def start_snap(page):
+    return page.evaluate(START_SNAP_SCRIPT)
+
+def prepare_pre_snap(pages, url=None, pocket_envelope=True, fullscreen_wait=5.0, fullscreen=True):
+    """
+    Brings pages to the pre-snap state, running each step across all pages
+    before the next so page loads and the fullscreen settle overlap
+    """
+    url = url or get_app_url()
+
+    # Start every navigation first; the browser loads them concurrently
+    for page in pages:
+        page.goto(url, wait_until='commit')
+    for page in pages:
+        wait_for_app(page)
+        open_coach_panel(page)
+
+    if fullscreen:
+        for page in pages:
+            page.keyboard.press('F11')
+        time.sleep(fullscreen_wait)  # One settle wait shared by every page (see CLAUDE.md)
+
+    for page in pages:
+        open_play_simulator(page)
+        if pocket_envelope is not None:
+            set_pocket_envelope(page, pocket_envelope)
+        wait_for_pre_snap(page)
+
+def hard_reset(page):
+    page.evaluate(HARD_RESET_SCRIPT)
+
+class PagePool:
+    """
+    Pool of pages parked at the pre-snap state.
+
+    checkout() hands out a ready page; checkin() fires the simulator's
+    hard-reset event and parks the page again. Pages that fail to reset are
+    discarded and replaced on the next fill().
+    """
+
+    def __init__(self, browser, size=2, url=None, pocket_envelope=True, fullscreen_wait=5.0, fullscreen=True):
+        self.browser = browser
+        self.size = size
+        self.url = url or get_app_url()
+        self.pocket_envelope = pocket_envelope
+        self.fullscreen_wait = fullscreen_wait
+        self.fullscreen = fullscreen
+        self._idle = []
+        self._busy = set()
+        self._storage_state = None
+        self.stats = {'prepared': 0, 'checkouts': 0, 'resets': 0, 'discarded': 0, 'setup_seconds': 0.0}
+
+    def _new_page(self):
+        context_config = get_context_config()
+        if self._storage_state:
+            # Reuse cookies and localStorage (e.g. qb_user_id) from the first warm page
+            context_config['storage_state'] = self._storage_state
+        context = self.browser.new_context(**context_config)
+        page = context.new_page()
+        page_config = get_page_config()
+        page.set_default_timeout(page_config['default_timeout'])
+        page.set_default_navigation_timeout(page_config['navigation_timeout'])
+        return page
+
+    def fill(self):
+        """
+        Prepares pages until the pool holds `size` pages
+        """
+        missing = self.size - len(self._idle) - len(self._busy)
+        if missing <= 0:
+            return
+        started = time.time()
+        pages = [self._new_page() for _ in range(missing)]
+        try:
+            prepare_pre_snap(pages, self.url, self.pocket_envelope, self.fullscreen_wait, self.fullscreen)
+        except Exception:
+            for page in pages:
+                self._discard(page)
+            raise
+        if self._storage_state is None:
+            self._storage_state = pages[0].context.storage_state()
+        self._idle.extend(pages)
+        self.stats['prepared'] += len(pages)
+        self.stats['setup_seconds'] += time.time() - started
+        print(f"🔥 Warmed {len(pages)} pages in {time.time() - started:.1f}s")
+
+    def checkout(self):
+        """
+        Returns a page parked at the pre-snap state
+        """
+        if not self._idle:
+            self.fill()
+        if not self._idle:
+            raise Exception("Page pool is exhausted, all pages are checked out")
+        page = self._idle.pop(0)
+        self._busy.add(page)
+        self.stats['checkouts'] += 1
+        return page
+
+    def checkin(self, page, reuse=True):
+        """
+        Resets a page to pre-snap and returns it to the pool. With reuse=False the page
+        is discarded instead, for tests that changed state hard-reset does not restore
+        """
+        self._busy.discard(page)
+        if not reuse:
+            self._discard(page)
+            return
+        try:
+            hard_reset(page)
+            if self.pocket_envelope is not None:
+                set_pocket_envelope(page, self.pocket_envelope)
+            if not is_pre_snap(page):
+                raise Exception("Simulator not back at pre-snap after hard-reset")
+        except Exception as e:
+            print(f"⚠️ Discarding pooled page: {e}")
+            self._discard(page)
+            return
+        self._idle.append(page)
+        self.stats['resets'] += 1
+
+    @contextmanager
+    def page(self, reuse=True):
+        page = self.checkout()
+        try:
+            yield page
+        finally:
+            self.checkin(page, reuse)
+
+    def _discard(self, page):
+        self.stats['discarded'] += 1
+        try:
+            page.context.close()
+        except Exception:
+            pass
+
+    def close(self):
+        for page in self._idle + list(self._busy):
+            try:
+                page.context.close()
+            except Exception:
+                pass
+        self._idle = []
+        self._busy = set()
+
+    def __enter__(self):
+        self.fill()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+if __name__ == "__main__":
+    from playwright.sync_api import sync_playwright
+    from playwright_config import get_launch_options
+
+    reps = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with sync_playwright() as p:
+        browser = p.chromium.launch(**get_launch_options())
+        try:
+            with PagePool(browser, size=2) as pool:
+                print(f"⏱️ Cold setup: {pool.stats['setup_seconds'] / pool.stats['prepared']:.1f}s per page")
+                for rep in range(reps):
+                    started = time.time()
+                    with pool.page() as page:
+                        checkout_ms = (time.time() - started) * 1000
+                        start_snap(page)
+                        time.sleep(1.0)
+                    print(f"🏈 Rep {rep + 1}: checkout {checkout_ms:.0f}ms")
+                print(f"📊 Pool stats: {pool.stats}")
+        finally:
+            browser.close()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+A/B Performance Comparison Between Two Builds
+Serves two revisions side by side, runs the same seeded snaps against both and gates regressions
+
+    python scripts/perf_ab.py --rev-a main --rev-b HEAD --rounds 10
+    python scripts/perf_ab.py --url-a http://localhost:3101 --url-b http://localhost:3102
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+import urllib.request
+from urllib.parse import urlencode
+from playwright.sync_api import sync_playwright
+from playwright_config import get_launch_options, get_context_config, get_page_config
+from page_pool import (wait_for_app, open_coach_panel, open_play_simulator, set_pocket_envelope,
+                       wait_for_pre_snap, start_snap)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Share-link params restore concept (c), coverage (cov), formation (f), playId and rngSeed
+DEFAULT_SCENARIOS = [
+    {'name': 'smash-c3-trips', 'query': {'c': 'SMASH', 'cov': 'C3', 'f': 'TRIPS_RIGHT', 'pid': '1', 'seed': '1234'},
+     'pocket': True},
+    {'name': 'mesh-c1-doubles', 'query': {'c': 'MESH', 'cov': 'C1', 'f': 'DOUBLES', 'pid': '1', 'seed': '98765'},
+     'pocket': True},
+    {'name': 'verts-quarters-bunch', 'query': {'c': 'FOUR_VERTS', 'cov': 'QUARTERS', 'f': 'BUNCH_LEFT', 'pid': '1',
+                                               'seed': '424242'}, 'pocket': False},
+]
+
+# startSnap() mixes Date.now() into the seed, so both builds snap under the same fixed clock
+SNAP_CLOCK = '2025-01-01T12:00:00Z'
+
+# Metrics where a higher value is a regression; the gate applies to these
+GATED_METRICS = ['frame_p95_ms', 'scripting_ms', 'heap_mb']
+
+# Records requestAnimationFrame deltas until window.__perfFrames.stop() is called
+FRAME_RECORDER_SCRIPT = """
+() => {
+    const frames = [];
+    let last = performance.now();
+    let running = true;
+    const tick = (now) => {
+        frames.push(now - last);
+        last = now;
+        if (running) requestAnimationFrame(tick);
+    };
+    requestAnimationFrame((now) => { last = now; requestAnimationFrame(tick); });
+    window.__perfFrames = { stop: () => { running = false; return frames; } };
+}
+"""
+
+def get_ab_config():
+    """
+    Returns default comparison settings
+    """
+    return {
+        'rounds': 8,              # Runs per build per scenario
+        'snap_seconds': 4.5,      # Measured window after Snap (covers pocket collapse)
+        'warmup_runs': 1,         # Unmeasured runs per build to warm server caches
+        'threshold_pct': 5.0,     # Fail when B is confidently this much worse than A
+        'confidence': 0.95,
+        'bootstrap_samples': 2000,
+        'port_a': 3101,
+        'port_b': 3102,
+        'seed': 7,
+    }
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+def bootstrap_ci(a, b, samples=2000, confidence=0.95, rng=None):
+    """
+    Percentile-bootstrap CI for mean(b) - mean(a)
+    """
+    rng = rng or random.Random(0)
+    diffs = []
+    for _ in range(samples):
+        resample_a = [rng.choice(a) for _ in a]
+        resample_b = [rng.choice(b) for _ in b]
+        diffs.append(mean(resample_b) - mean(resample_a))
+    diffs.sort()
+    tail = (1 - confidence) / 2
+    low = diffs[int(tail * (samples - 1))]
+    high = diffs[int((1 - tail) * (samples - 1))]
+    return low, high
+
+# --- Serving builds -----------------------------------------------------------
+
+def wait_for_server(url, server, wait=90):
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=2)
+            return
+        except Exception:
+            if server.poll() is not None:
+                raise Exception(f"Server for {url} exited during startup")
+            time.sleep(1)
+    raise Exception(f"Server for {url} did not become ready in time")
+
+def prepare_build(rev, workdir):
+    """
+    Checks out rev into a git worktree and runs a production build there
+    """
+    print(f"📦 Building {rev} in {workdir}...")
+    subprocess.run(['git', 'worktree', 'add', '--detach', workdir, rev], cwd=REPO_ROOT, check=True,
+                   capture_output=True)
+
+    # Reuse installed packages when the lockfile matches; otherwise install fresh
+    with open(os.path.join(REPO_ROOT, 'package-lock.json')) as ours, \
+            open(os.path.join(workdir, 'package-lock.json')) as theirs:
+        same_lock = ours.read() == theirs.read()
+    if same_lock and os.path.isdir(os.path.join(REPO_ROOT, 'node_modules')):
+        os.symlink(os.path.join(REPO_ROOT, 'node_modules'), os.path.join(workdir, 'node_modules'))
+    else:
+        subprocess.run(['npm', 'ci'], cwd=workdir, check=True)
+
+    env = dict(os.environ, NEXT_TELEMETRY_DISABLED='1')
+    subprocess.run(['npx', 'next', 'build'], cwd=workdir, check=True, env=env)
+
+def serve_build(workdir, port):
+    env = dict(os.environ, NEXT_TELEMETRY_DISABLED='1')
+    server = subprocess.Popen(['npx', 'next', 'start', '-p', str(port)], cwd=workdir, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://localhost:{port}"
+    wait_for_server(url, server)
+    print(f"✅ Serving {workdir} at {url}")
+    return server, url
+
+def remove_worktree(workdir):
+    subprocess.run(['git', 'worktree', 'remove', '--force', workdir], cwd=REPO_ROOT, capture_output=True)
+    shutil.rmtree(workdir, ignore_errors=True)
+
+# --- Measuring ------------------------------------------------------------------
+
+def measure_snap(browser, url, scenario, snap_seconds):
+    """
+    Loads a scenario in a fresh context, snaps, and returns frame/scripting/heap metrics
+    """
+    context = browser.new_context(**get_context_config())
+    try:
+        page = context.new_page()
+        page_config = get_page_config()
+        page.set_default_timeout(page_config['default_timeout'])
+        page.set_default_navigation_timeout(page_config['navigation_timeout'])
+
+        page.clock.set_fixed_time(SNAP_CLOCK)
+        page.goto(f"{url.rstrip('/')}/?{urlencode(scenario['query'])}")
+        wait_for_app(page)
+        open_coach_panel(page)
+        open_play_simulator(page)
+        set_pocket_envelope(page, scenario.get('pocket', True))
+        wait_for_pre_snap(page)
+
+        cdp = context.new_cdp_session(page)
+        cdp.send('Performance.enable')
+        cdp.send('HeapProfiler.collectGarbage')
+        before = {m['name']: m['value'] for m in cdp.send('Performance.getMetrics')['metrics']}
+
+        page.evaluate(FRAME_RECORDER_SCRIPT)
+        start_snap(page)
+        page.wait_for_timeout(snap_seconds * 1000)
+        frames = page.evaluate("() => window.__perfFrames.stop()")
+
+        after = {m['name']: m['value'] for m in cdp.send('Performance.getMetrics')['metrics']}
+        budget = 1000 / 60
+        return {
+            'frame_mean_ms': mean(frames),
+            'frame_p95_ms': percentile(frames, 95),
+            'dropped_frames': sum(1 for f in frames if f > budget * 1.5),
+            'scripting_ms': (after.get('ScriptDuration', 0) - before.get('ScriptDuration', 0)) * 1000,
+            'layout_ms': (after.get('LayoutDuration', 0) - before.get('LayoutDuration', 0)) * 1000,
+            'heap_mb': after.get('JSHeapUsedSize', 0) / (1024 * 1024),
+        }
+    finally:
+        context.close()
+
+def run_alternating(browser, urls, scenarios, config):
+    """
+    Runs every scenario on both builds, alternating A/B and B/A each round so drift
+    (thermal throttling, background load, cache warm-up) lands on both sides equally
+    """
+    results = {scenario['name']: {'A': [], 'B': []} for scenario in scenarios}
+
+    for scenario in scenarios:
+        for label in ('A', 'B'):
+            for warmup_index in range(config['warmup_runs']):
+                try:
+                    measure_snap(browser, urls[label], scenario, config['snap_seconds'])
+                except Exception as e:
+                    print(f"⚠️ Warm-up {warmup_index + 1} {scenario['name']} [{label}] failed: {e}")
+
+    for round_index in range(config['rounds']):
+        order = ('A', 'B') if round_index % 2 == 0 else ('B', 'A')
+        for scenario in scenarios:
+            for label in order:
+                try:
+                    metrics = measure_snap(browser, urls[label], scenario, config['snap_seconds'])
+                    results[scenario['name']][label].append(metrics)
+                    print(f"📈 Round {round_index + 1} {scenario['name']} [{label}]: "
+                          f"p95 frame {metrics['frame_p95_ms']:.1f}ms, "
+                          f"scripting {metrics['scripting_ms']:.0f}ms, heap {metrics['heap_mb']:.1f}MB")
+                except Exception as e:
+                    print(f"⚠️ Round {round_index + 1} {scenario['name']} [{label}] failed: {e}")
+    return results
+
+def compare(results, config):
+    """
+    Returns per-scenario, per-metric comparisons and the overall verdict
+    """
+    rng = random.Random(config['seed'])
+    report = {'scenarios': {}, 'failures': [], 'threshold_pct': config['threshold_pct']}
+    for name, runs in results.items():
+        if len(runs['A']) < 2 or len(runs['B']) < 2:
+            report['failures'].append(f"{name}: not enough successful runs")
+            continue
+        metrics = {}
+        for metric in runs['A'][0]:
+            a = [r[metric] for r in runs['A']]
+            b = [r[metric] for r in runs['B']]
+            low, high = bootstrap_ci(a, b, config['bootstrap_samples'], config['confidence'], rng)
+            base = mean(a)
+            pct = lambda value: value / base * 100 if base else None
+            entry = {
+                'mean_a': mean(a), 'mean_b': mean(b),
+                'diff': mean(b) - mean(a),
+                'ci_low': low, 'ci_high': high,
+                'change_pct': pct(mean(b) - mean(a)),
+                'ci_low_pct': pct(low),
+                'ci_high_pct': pct(high),
+                'regressed': False,
+            }
+            # Only fail when even the optimistic end of the interval is past the threshold
+            if (metric in GATED_METRICS and entry['ci_low_pct'] is not None
+                    and entry['ci_low_pct'] > config['threshold_pct']):
+                entry['regressed'] = True
+                report['failures'].append(f"{name}: {metric} +{entry['change_pct']:.1f}% "
+                                          f"(CI {entry['ci_low_pct']:+.1f}%..{entry['ci_high_pct']:+.1f}%)")
+            metrics[metric] = entry
+        report['scenarios'][name] = metrics
+    report['passed'] = not report['failures']
+    return report
+
+def print_report(report, labels):
+    print(f"\n📊 A/B Performance Report — A: {labels['A']}  B: {labels['B']}")
+    print("=" * 72)
+    for name, metrics in report['scenarios'].items():
+        print(f"\n🏈 {name}")
+        print(f"  {'metric':<16}{'A':>10}{'B':>10}{'change':>10}{'confidence interval':>22}")
+        for metric, entry in metrics.items():
+            flag = " ❌" if entry['regressed'] else ""
+            if entry['change_pct'] is None:
+                change = f"{entry['diff']:>+10.2f}"
+                interval = f"{entry['ci_low']:>+10.2f}..{entry['ci_high']:>+7.2f}"
+            else:
+                change = f"{entry['change_pct']:>+9.1f}%"
+                interval = f"{entry['ci_low_pct']:>+10.1f}%..{entry['ci_high_pct']:>+6.1f}%"
+            print(f"  {metric:<16}{entry['mean_a']:>10.2f}{entry['mean_b']:>10.2f}{change}{interval}{flag}")
+    print()
+    if report['passed']:
+        print(f"✅ PASS: no gated metric regressed by more than {report['threshold_pct']:.0f}%")
+    else:
+        print(f"❌ FAIL: regressions beyond {report['threshold_pct']:.0f}%")
+        for failure in report['failures']:
+            print(f"   - {failure}")
+
+def main():
+    config = get_ab_config()
+    parser = argparse.ArgumentParser(description="Compare rendering performance of two builds")
+    parser.add_argument('--rev-a', default='HEAD~1', help="Baseline git revision")
+    parser.add_argument('--rev-b', default='HEAD', help="Candidate git revision")
+    parser.add_argument('--url-a', help="Compare an already-running baseline server instead of building")
+    parser.add_argument('--url-b', help="Compare an already-running candidate server instead of building")
+    parser.add_argument('--rounds', type=int, default=config['rounds'])
+    parser.add_argument('--threshold', type=float, default=config['threshold_pct'],
+                        help="Regression threshold in percent")
+    parser.add_argument('--scenarios', help="JSON file with a list of {name, query, pocket} scenarios")
+    parser.add_argument('--headless', action='store_true')
+    parser.add_argument('--json', dest='json_path', help="Write the full report to this file")
+    args = parser.parse_args()
+
+    config.update({'rounds': args.rounds, 'threshold_pct': args.threshold})
+    scenarios = DEFAULT_SCENARIOS
+    if args.scenarios:
+        with open(args.scenarios) as f:
+            scenarios = json.load(f)
+
+    servers = []
+    worktrees = []
+    labels = {'A': args.url_a or args.rev_a, 'B': args.url_b or args.rev_b}
+    urls = {'A': args.url_a, 'B': args.url_b}
+    try:
+        for label, rev, port in (('A', args.rev_a, config['port_a']), ('B', args.rev_b, config['port_b'])):
+            if urls[label]:
+                continue
+            workdir = tempfile.mkdtemp(prefix=f"perf-ab-{label.lower()}-")
+            os.rmdir(workdir)  # git worktree add wants to create it
+            worktrees.append(workdir)
+            prepare_build(rev, workdir)
+            server, urls[label] = serve_build(workdir, port)
+            servers.append(server)
+
+        with sync_playwright() as p:
+            launch_options = get_launch_options()
+            if args.headless:
+                launch_options['headless'] = True
+            browser = p.chromium.launch(**launch_options)
+            try:
+                results = run_alternating(browser, urls, scenarios, config)
+            finally:
+                browser.close()
+    finally:
+        for server in servers:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        for workdir in worktrees:
+            remove_worktree(workdir)
+        if servers or worktrees:
+            print("🧹 Servers stopped and worktrees removed")
+
+    report = compare(results, config)
+    report['labels'] = labels
+    report['runs'] = results
+    print_report(report, labels)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report saved: {args.json_path}")
+
+    sys.exit(0 if report['passed'] else 1)
+
+if __name__ == "__main__":
+    main()
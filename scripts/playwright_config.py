@@ -4,6 +4,14 @@ Playwright Configuration for macOS Stability
 Centralized browser launch configuration with optimal settings
 """
 
+import os
+
+def get_app_url():
+    """
+    Returns the base URL of the running app (override with APP_URL)
+    """
+    return os.environ.get('APP_URL', 'http://localhost:3007')
+
 def get_browser_config():
     """
     Returns optimized browser configuration for macOS
@@ -51,6 +59,13 @@ def get_browser_config():
         'timeout': 60000,  # 60 second timeout
     }
 
+def get_launch_options():
+    """
+    Returns the subset of the browser config accepted by chromium.launch()
+    """
+    config = get_browser_config()
+    return {key: config[key] for key in ('headless', 'args', 'timeout')}
+
 def get_page_config():
     """
     Returns optimized page configuration
@@ -76,8 +91,7 @@ def create_stable_browser(playwright):
     """
     Creates a browser instance with stable configuration
     """
-    config = get_browser_config()
-    browser = playwright.chromium.launch(**config)
+    browser = playwright.chromium.launch(**get_launch_options())
     
     context_config = get_context_config()
     context = browser.new_context(**context_config)
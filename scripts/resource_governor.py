@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+Resource Governor for Playwright
+In-process watchdog that recycles browsers, adapts concurrency and reaps orphans
+"""
+
+import os
+import sys
+import time
+import atexit
+import signal
+import threading
+import subprocess
+from playwright_config import get_launch_options, get_context_config, get_page_config
+
+BROWSER_MARKERS = ('chrome', 'chromium', 'headless_shell')
+PLAYWRIGHT_MARKERS = ('ms-playwright', '--remote-debugging-pipe')
+
+def get_governor_config():
+    """
+    Returns default limits for browser recycling and worker concurrency
+    """
+    return {
+        'max_tests_per_browser': 20,   # Recycle after this many tests
+        'max_browser_rss_mb': 1500,    # Recycle once the process tree grows past this
+        'min_workers': 1,
+        'max_workers': 4,
+        'worker_memory_mb': 800,       # Expected footprint of one browser worker
+        'memory_reserve_mb': 1024,     # Always keep this much free for the OS and dev server
+        'sample_interval': 2.0,        # Seconds between concurrency adjustments
+        'kill_grace': 2.0,             # Seconds between SIGTERM and SIGKILL
+    }
+
+def list_processes():
+    """
+    Returns {pid: info} for every process visible to ps (macOS and Linux)
+    """
+    try:
+        output = subprocess.run(
+            ['ps', '-axo', 'pid=,ppid=,rss=,%cpu=,command='],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except Exception as e:
+        print(f"⚠️ Could not list processes: {e}")
+        return {}
+
+    processes = {}
+    for line in output.splitlines():
+        parts = line.split(None, 4)
+        if len(parts) < 4:
+            continue
+        try:
+            pid, ppid, rss_kb = int(parts[0]), int(parts[1]), int(parts[2])
+            cpu = float(parts[3].replace(',', '.'))
+        except ValueError:
+            continue
+        processes[pid] = {
+            'pid': pid,
+            'ppid': ppid,
+            'rss_mb': rss_kb / 1024,
+            'cpu': cpu,
+            'command': parts[4] if len(parts) > 4 else '',
+        }
+    return processes
+
+def get_start_times(pids):
+    """
+    Returns {pid: start time} as reported by ps, so a reused PID can be told apart
+    """
+    pids = list(pids)
+    if not pids:
+        return {}
+    try:
+        output = subprocess.run(
+            ['ps', '-o', 'pid=,lstart=', '-p', ','.join(str(pid) for pid in pids)],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except Exception as e:
+        print(f"⚠️ Could not read process start times: {e}")
+        return {}
+
+    starts = {}
+    for line in output.splitlines():
+        parts = line.split(None, 1)
+        if len(parts) == 2 and parts[0].isdigit():
+            starts[int(parts[0])] = parts[1].strip()
+    return starts
+
+def get_free_memory_mb():
+    """
+    Returns memory available to new processes in MB, or None if unknown
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            with open('/proc/meminfo') as f:
+                for line in f:
+                    if line.startswith('MemAvailable:'):
+                        return int(line.split()[1]) / 1024
+            return None
+
+        # macOS: free + inactive + speculative pages are reclaimable
+        output = subprocess.run(['vm_stat'], capture_output=True, text=True, timeout=10).stdout
+        page_size = 4096
+        pages = 0
+        for line in output.splitlines():
+            if 'page size of' in line:
+                page_size = int(line.split('page size of')[1].split()[0])
+            elif line.startswith(('Pages free', 'Pages inactive', 'Pages speculative')):
+                pages += int(line.split(':')[1].strip().rstrip('.'))
+        return pages * page_size / (1024 * 1024)
+    except Exception as e:
+        print(f"⚠️ Could not read free memory: {e}")
+        return None
+
+def is_browser_process(info):
+    command = info['command'].lower()
+    return any(marker in command for marker in BROWSER_MARKERS)
+
+def process_tree(root_pid, processes):
+    """
+    Returns root_pid and all of its descendants
+    """
+    children = {}
+    for info in processes.values():
+        children.setdefault(info['ppid'], []).append(info['pid'])
+
+    tree = []
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        if pid in processes and pid not in tree:
+            tree.append(pid)
+            pending.extend(children.get(pid, []))
+    return tree
+
+def descends_from(pid, ancestor_pid, processes):
+    """
+    Returns True if ancestor_pid is on pid's parent chain
+    """
+    seen = set()
+    while pid in processes and pid not in seen:
+        seen.add(pid)
+        pid = processes[pid]['ppid']
+        if pid == ancestor_pid:
+            return True
+    return False
+
+def tree_usage(root_pid, processes=None):
+    """
+    Returns total RSS and CPU for a browser process tree
+    """
+    processes = processes if processes is not None else list_processes()
+    pids = process_tree(root_pid, processes)
+    return {
+        'pid': root_pid,
+        'pids': pids,
+        'rss_mb': sum(processes[pid]['rss_mb'] for pid in pids),
+        'cpu': sum(processes[pid]['cpu'] for pid in pids),
+    }
+
+def find_browser_roots(processes, ancestor_pid=None):
+    """
+    Returns browser processes whose parent is not itself a browser process.
+    When ancestor_pid is given, only browsers descended from it are returned.
+    """
+    candidates = processes
+    if ancestor_pid is not None:
+        candidates = {pid: processes[pid] for pid in process_tree(ancestor_pid, processes)}
+
+    roots = []
+    for pid, info in candidates.items():
+        if pid == ancestor_pid or not is_browser_process(info):
+            continue
+        parent = processes.get(info['ppid'])
+        if parent is None or not is_browser_process(parent):
+            roots.append(pid)
+    return roots
+
+def find_orphaned_browsers(processes=None):
+    """
+    Returns Playwright-launched browser roots that were reparented to init/launchd
+    """
+    processes = processes if processes is not None else list_processes()
+    orphans = []
+    for pid in find_browser_roots(processes):
+        info = processes[pid]
+        if info['ppid'] == 1 and any(marker in info['command'] for marker in PLAYWRIGHT_MARKERS):
+            orphans.append(pid)
+    return orphans
+
+def kill_pids(pids, grace=2.0):
+    """
+    Sends SIGTERM, waits up to grace seconds, then SIGKILLs survivors
+    """
+    alive = []
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            alive.append(pid)
+        except (ProcessLookupError, PermissionError):
+            continue
+
+    deadline = time.time() + grace
+    while alive and time.time() < deadline:
+        time.sleep(0.1)
+        alive = [pid for pid in alive if _pid_alive(pid)]
+
+    for pid in alive:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    return len(pids)
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    # Reap our own zombies so they stop counting as alive
+    try:
+        finished, _ = os.waitpid(pid, os.WNOHANG)
+        return finished == 0
+    except ChildProcessError:
+        return True
+
+class ManagedBrowser:
+    """
+    A browser launched by the governor, with its process tree and usage counters
+    """
+
+    def __init__(self, browser, pid):
+        self.browser = browser
+        self.pid = pid
+        self.tests_run = 0
+        self.peak_rss_mb = 0.0
+        self.launched_at = time.time()
+
+class ResourceGovernor:
+    """
+    Tracks browser process trees, recycles them past their limits and sizes the worker pool
+    """
+
+    def __init__(self, config=None):
+        self.config = get_governor_config()
+        self.config.update(config or {})
+        self._browsers = []
+        self._known_pids = {}          # pid -> start time, for every process seen in our trees
+        self._lock = threading.Lock()
+        self.worker_limit = self.config['min_workers']
+        self.recycled = 0
+        self._install_exit_hooks()
+
+    def _install_exit_hooks(self):
+        atexit.register(self.cleanup_orphans)
+        if threading.current_thread() is not threading.main_thread():
+            return
+        # atexit does not run on SIGTERM, so turn it into a normal exit
+        if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+    def launch(self, playwright):
+        """
+        Launches a browser and identifies the root PID of its process tree
+        """
+        with self._lock:
+            before = set(find_browser_roots(list_processes(), os.getpid()))
+            browser = playwright.chromium.launch(**get_launch_options())
+            processes = list_processes()
+            new_roots = [pid for pid in find_browser_roots(processes, os.getpid()) if pid not in before]
+
+            pid = new_roots[0] if new_roots else None
+            managed = ManagedBrowser(browser, pid)
+            self._browsers.append(managed)
+            if pid is not None:
+                self._remember(process_tree(pid, processes))
+            else:
+                print("⚠️ Could not identify browser PID, memory limit will not apply")
+            print(f"🚀 Browser launched (pid {pid})")
+            return managed
+
+    def sample(self, managed):
+        """
+        Returns current RSS/CPU of a browser tree and records its peak
+        """
+        if managed.pid is None:
+            return None
+        processes = list_processes()
+        usage = tree_usage(managed.pid, processes)
+        with self._lock:
+            # Forget exited renderers so their PIDs can't be reused into a later kill list
+            for pid in [pid for pid in self._known_pids if pid not in processes]:
+                del self._known_pids[pid]
+            self._remember(usage['pids'])
+        managed.peak_rss_mb = max(managed.peak_rss_mb, usage['rss_mb'])
+        return usage
+
+    def recycle_reason(self, managed):
+        """
+        Returns why a browser should be recycled, or None if it can keep going
+        """
+        if managed.tests_run >= self.config['max_tests_per_browser']:
+            return f"{managed.tests_run} tests run"
+        usage = self.sample(managed)
+        if usage and usage['rss_mb'] >= self.config['max_browser_rss_mb']:
+            return f"RSS {usage['rss_mb']:.0f}MB over {self.config['max_browser_rss_mb']}MB"
+        return None
+
+    def checkin(self, managed, playwright):
+        """
+        Records a finished test and returns the browser to use next, recycling if needed
+        """
+        managed.tests_run += 1
+        reason = self.recycle_reason(managed)
+        if not reason:
+            return managed
+        print(f"♻️ Recycling browser (pid {managed.pid}): {reason}")
+        self.close(managed)
+        self.recycled += 1
+        return self.launch(playwright)
+
+    def close(self, managed):
+        """
+        Closes a browser and kills anything left in its process tree
+        """
+        leftover = process_tree(managed.pid, list_processes()) if managed.pid else []
+        try:
+            managed.browser.close()
+        except Exception:
+            pass
+        survivors = [pid for pid in leftover if _pid_alive(pid)]
+        if survivors:
+            kill_pids(survivors, self.config['kill_grace'])
+        with self._lock:
+            if managed in self._browsers:
+                self._browsers.remove(managed)
+            for pid in leftover:
+                self._known_pids.pop(pid, None)
+
+    def _remember(self, pids):
+        new = [pid for pid in pids if pid not in self._known_pids]
+        starts = get_start_times(new)
+        for pid in new:
+            self._known_pids[pid] = starts.get(pid)
+
+    def _is_ours(self, pid, started, processes, current_starts):
+        """
+        True if a known PID still belongs to a browser from this run (not a reused PID)
+        """
+        info = processes.get(pid)
+        if info is None or not is_browser_process(info):
+            return False
+        if started is not None:
+            return current_starts.get(pid) == started
+        # No recorded start time: accept our own descendants and reparented Playwright roots
+        if info['ppid'] == 1:
+            return any(marker in info['command'] for marker in PLAYWRIGHT_MARKERS)
+        return descends_from(pid, os.getpid(), processes)
+
+    def recommended_workers(self):
+        """
+        Returns how many parallel workers fit in the currently free memory
+        """
+        free_mb = get_free_memory_mb()
+        if free_mb is None:
+            return self.worker_limit
+        with self._lock:
+            active = len(self._browsers)
+        headroom = free_mb - self.config['memory_reserve_mb']
+        target = active + int(headroom // self.config['worker_memory_mb'])
+        return max(self.config['min_workers'], min(self.config['max_workers'], target))
+
+    def adjust_workers(self):
+        """
+        Updates worker_limit from free memory and reports changes
+        """
+        target = self.recommended_workers()
+        if target != self.worker_limit:
+            direction = "⬆️ Raising" if target > self.worker_limit else "⬇️ Lowering"
+            print(f"{direction} workers {self.worker_limit} -> {target}")
+            self.worker_limit = target
+        return self.worker_limit
+
+    def cleanup_orphans(self):
+        """
+        Kills browser processes left behind by this run
+        """
+        processes = list_processes()
+        own_pid = os.getpid()
+        with self._lock:
+            known = dict(self._known_pids)
+        # Browsers whose driver died are reparented to init, so match them by PID and
+        # start time rather than ancestry; their descendants go with them
+        current_starts = get_start_times(pid for pid in known if pid in processes)
+        pids = set()
+        for pid, started in known.items():
+            if self._is_ours(pid, started, processes, current_starts):
+                pids.update(process_tree(pid, processes))
+        for root in find_browser_roots(processes, own_pid):
+            pids.update(process_tree(root, processes))
+        pids.discard(own_pid)
+        if pids:
+            print(f"🧹 Killing {len(pids)} leftover browser processes")
+            kill_pids(sorted(pids), self.config['kill_grace'])
+        with self._lock:
+            self._known_pids.clear()
+            self._browsers.clear()
+
+    def report(self):
+        """
+        Returns a snapshot of tracked browsers and system memory
+        """
+        processes = list_processes()
+        with self._lock:
+            browsers = list(self._browsers)
+        return {
+            'free_memory_mb': get_free_memory_mb(),
+            'worker_limit': self.worker_limit,
+            'recycled': self.recycled,
+            'browsers': [
+                dict(tree_usage(b.pid, processes), tests_run=b.tests_run, peak_rss_mb=b.peak_rss_mb)
+                for b in browsers if b.pid is not None
+            ],
+        }
+
+def run_governed(tests, governor=None):
+    """
+    Runs (name, test_logic) pairs across governed workers.
+
+    Each worker thread owns its own Playwright instance and browser. Worker N
+    only takes tests while N is below the governor's worker limit, so the pool
+    shrinks when memory gets tight and grows again when it frees up.
+    """
+    from playwright.sync_api import sync_playwright
+
+    governor = governor or ResourceGovernor()
+    pending = list(tests)
+    results = []
+    queue_lock = threading.Lock()
+    done = threading.Event()
+
+    def next_test():
+        with queue_lock:
+            return pending.pop(0) if pending else None
+
+    def worker(index):
+        playwright = None
+        managed = None
+        try:
+            while not done.is_set():
+                if index >= governor.worker_limit:
+                    # Parked: give the memory back until the limit rises again
+                    if managed:
+                        governor.close(managed)
+                        managed = None
+                    time.sleep(governor.config['sample_interval'])
+                    continue
+
+                item = next_test()
+                if item is None:
+                    return
+                name, test_logic = item
+
+                if playwright is None:
+                    playwright = sync_playwright().start()
+                if managed is None:
+                    managed = governor.launch(playwright)
+
+                started = time.time()
+                context = managed.browser.new_context(**get_context_config())
+                try:
+                    page = context.new_page()
+                    page_config = get_page_config()
+                    page.set_default_timeout(page_config['default_timeout'])
+                    page.set_default_navigation_timeout(page_config['navigation_timeout'])
+                    print(f"🚀 [worker {index}] Starting {name}...")
+                    value = test_logic(page)
+                    results.append({'name': name, 'ok': True, 'result': value, 'error': None,
+                                    'duration': time.time() - started})
+                    print(f"✅ [worker {index}] {name} completed")
+                except Exception as e:
+                    results.append({'name': name, 'ok': False, 'result': None, 'error': str(e),
+                                    'duration': time.time() - started})
+                    print(f"❌ [worker {index}] {name} failed: {e}")
+                finally:
+                    try:
+                        context.close()
+                    except Exception:
+                        pass
+                managed = governor.checkin(managed, playwright)
+        finally:
+            if managed:
+                governor.close(managed)
+            if playwright:
+                try:
+                    playwright.stop()
+                except Exception:
+                    pass
+
+    governor.adjust_workers()
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True)
+               for i in range(governor.config['max_workers'])]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while any(thread.is_alive() for thread in threads):
+            with queue_lock:
+                if not pending:
+                    done.set()
+            governor.adjust_workers()
+            time.sleep(governor.config['sample_interval'])
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join(timeout=30)
+        governor.cleanup_orphans()
+
+    return results
+
+def print_status():
+    governor_config = get_governor_config()
+    processes = list_processes()
+    free_mb = get_free_memory_mb()
+
+    print("🔍 Playwright Resource Governor")
+    print("=" * 40)
+    print(f"💾 Free memory: {free_mb:.0f}MB" if free_mb is not None else "💾 Free memory: unknown")
+
+    roots = find_browser_roots(processes)
+    orphans = find_orphaned_browsers(processes)
+    if not roots:
+        print("✅ No browser processes found")
+    for pid in roots:
+        usage = tree_usage(pid, processes)
+        orphan = " (orphaned)" if pid in orphans else ""
+        print(f"  PID {pid}: {usage['rss_mb']:.0f}MB RSS, {usage['cpu']:.1f}% CPU, "
+              f"{len(usage['pids'])} processes{orphan}")
+
+    if free_mb is not None:
+        headroom = free_mb - governor_config['memory_reserve_mb']
+        workers = int(headroom // governor_config['worker_memory_mb'])
+        workers = max(governor_config['min_workers'], min(governor_config['max_workers'], workers))
+        print(f"⚙️ Recommended workers: {workers}")
+
+if __name__ == "__main__":
+    if '--cleanup' in sys.argv:
+        orphans = find_orphaned_browsers()
+        processes = list_processes()
+        pids = sorted({pid for root in orphans for pid in process_tree(root, processes)})
+        if pids:
+            print(f"🧹 Killing {len(orphans)} orphaned browsers ({len(pids)} processes)")
+            kill_pids(pids)
+        else:
+            print("✅ No orphaned browsers found")
+    else:
+        print_status()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Declarative Timed-Scenario Engine for the Play Simulator
+Runs JSON scenario specs (setup toggles, events, timeline, expected phases) as optimized plans
+
+    python scripts/scenario_engine.py                          # every spec in scripts/scenarios/
+    python scripts/scenario_engine.py scripts/scenarios/ol_dl_focused.json
+
+A spec looks like:
+
+    {
+      "name": "ol-dl-focused",
+      "setup": {"fullscreen": true, "pocket_envelope": true, "query": {"cov": "C3"}},
+      "events": [{"event": "set-formation", "detail": {"formation": "DOUBLES"}}],
+      "phases": [{"name": "Initial rush", "from": 0, "to": 0.5}],
+      "probes": {"pocket": {"kind": "text", "selector": "svg text", "has_text": "Pocket:"}},
+      "timeline": [
+        {"at": 0.5, "capture": true, "label": "initial contact"},
+        {"at": 2.7, "assert": [{"probe": "pocket", "match": "(\\\\d+)%", "max": 100}]}
+      ]
+    }
+
+Plans batch every probe for one timestamp into a single browser round trip, time them against
+the in-page snap instant instead of Python sleeps, and share one warm page between scenarios
+whose setup toggles match (reset with the simulator's hard-reset event). hard-reset does not
+undo events, so a scenario that fires any is followed by a freshly warmed page.
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+from urllib.parse import urlencode
+from playwright_config import get_app_url
+from page_pool import PagePool
+from resource_governor import ResourceGovernor
+
+SCENARIOS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scenarios')
+OUTPUT_DIR = '.playwright-mcp'
+
+DEFAULT_SETUP = {'fullscreen': True, 'pocket_envelope': True, 'query': {}}
+PROBE_KINDS = ('text', 'visible', 'count', 'position', 'eval')
+
+# Dispatches pre-snap events, lets React apply them, fires the simulator's start-snap event
+# (the Snap buttons outside fullscreen only flip the phase) and returns the snap instant
+SNAP_SCRIPT = """
+async (events) => {
+    const frame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+    for (const e of events) window.dispatchEvent(new CustomEvent(e.event, { detail: e.detail }));
+    if (events.length) { await frame(); await frame(); }
+    window.dispatchEvent(new CustomEvent('start-snap'));
+    return performance.now();
+}
+"""
+
+# Waits (frame by frame) until snapAt + at, then reads every probe and fires timeline dispatches
+STEP_SCRIPT = """
+async ({ snapAt, at, probes, dispatch }) => {
+    const target = snapAt + at * 1000;
+    while (performance.now() < target) await new Promise(resolve => requestAnimationFrame(resolve));
+    const find = (p) => {
+        const nodes = Array.from(document.querySelectorAll(p.selector || '*'));
+        return p.has_text ? nodes.filter(n => (n.textContent || '').includes(p.has_text)) : nodes;
+    };
+    const out = { t: (performance.now() - snapAt) / 1000, values: {} };
+    for (const p of probes) {
+        try {
+            if (p.kind === 'text') {
+                const el = find(p)[0];
+                out.values[p.id] = el ? el.textContent.trim() : null;
+            } else if (p.kind === 'visible') {
+                const el = find(p)[0];
+                out.values[p.id] = !!el && el.getClientRects().length > 0;
+            } else if (p.kind === 'count') {
+                out.values[p.id] = find(p).length;
+            } else if (p.kind === 'position') {
+                const el = find(p).find(n => n.textContent.trim() === p.label);
+                out.values[p.id] = el ? { x: Number(el.getAttribute('x')), y: Number(el.getAttribute('y')) } : null;
+            } else if (p.kind === 'eval') {
+                out.values[p.id] = new Function('return (' + p.expression + ')')();
+            }
+        } catch (e) {
+            out.values[p.id] = { error: String(e) };
+        }
+    }
+    for (const e of dispatch) window.dispatchEvent(new CustomEvent(e.event, { detail: e.detail }));
+    return out;
+}
+"""
+
+def load_spec(path):
+    with open(path) as f:
+        spec = json.load(f)
+    spec.setdefault('name', os.path.splitext(os.path.basename(path))[0])
+    return spec
+
+def load_specs(paths=None):
+    paths = paths or sorted(glob.glob(os.path.join(SCENARIOS_DIR, '*.json')))
+    return [load_spec(path) for path in paths]
+
+def phase_at(phases, at):
+    for phase in phases:
+        if phase.get('from', 0) <= at < phase.get('to', float('inf')):
+            return phase['name']
+    return None
+
+def build_plan(spec):
+    """
+    Compiles a spec into one step per distinct timestamp, each carrying every probe,
+    capture, assertion and dispatch due at that instant
+    """
+    setup = dict(DEFAULT_SETUP, **spec.get('setup', {}))
+    probes = spec.get('probes', {})
+    for probe_id, probe in probes.items():
+        if probe.get('kind') not in PROBE_KINDS:
+            raise ValueError(f"{spec['name']}: probe '{probe_id}' has unknown kind {probe.get('kind')!r}")
+
+    steps = {}
+    for entry in spec.get('timeline', []):
+        at = round(float(entry['at']), 3)
+        step = steps.setdefault(at, {'at': at, 'labels': [], 'probe_ids': set(), 'capture': False,
+                                     'asserts': [], 'dispatch': []})
+        if entry.get('label'):
+            step['labels'].append(entry['label'])
+        step['capture'] = step['capture'] or bool(entry.get('capture'))
+        step['probe_ids'].update(entry.get('probes', []))
+        for check in entry.get('assert', []):
+            if check['probe'] not in probes:
+                raise ValueError(f"{spec['name']}: assertion at {at}s uses unknown probe '{check['probe']}'")
+            step['probe_ids'].add(check['probe'])
+            step['asserts'].append(check)
+        step['dispatch'].extend(entry.get('dispatch', []))
+
+    unknown = {pid for step in steps.values() for pid in step['probe_ids']} - set(probes)
+    if unknown:
+        raise ValueError(f"{spec['name']}: timeline uses unknown probes {sorted(unknown)}")
+
+    phases = spec.get('phases', [])
+    ordered = []
+    for at in sorted(steps):
+        step = steps[at]
+        step['probes'] = [dict(probes[pid], id=pid) for pid in sorted(step.pop('probe_ids'))]
+        step['phase'] = phase_at(phases, at)
+        ordered.append(step)
+
+    return {
+        'name': spec['name'],
+        'description': spec.get('description', ''),
+        'setup': setup,
+        'setup_key': json.dumps(setup, sort_keys=True),
+        'events': spec.get('events', []),
+        # hardReset() leaves formation, star and fire-zone state alone, so a page that
+        # received events can't be handed to the next scenario
+        'reuse_page': not spec.get('events') and not any(step['dispatch'] for step in ordered),
+        'screenshot_prefix': spec.get('screenshot_prefix', spec['name']),
+        'steps': ordered,
+    }
+
+def check_assertion(check, value):
+    """
+    Returns None if the assertion holds, else a failure message
+    """
+    probe = check['probe']
+    if isinstance(value, dict) and 'error' in value:
+        return f"{probe}: probe error {value['error']}"
+    if 'match' in check:
+        found = re.search(check['match'], str(value)) if value is not None else None
+        if not found:
+            return f"{probe}: {value!r} does not match {check['match']!r}"
+        value = found.group(1) if found.groups() else found.group(0)
+    if 'field' in check and isinstance(value, dict):
+        value = value.get(check['field'])
+    if 'equals' in check and value != check['equals']:
+        return f"{probe}: {value!r} != {check['equals']!r}"
+    if check.get('truthy') and not value:
+        return f"{probe}: {value!r} is not truthy"
+    if check.get('falsy') and value:
+        return f"{probe}: {value!r} is not falsy"
+    if 'min' in check or 'max' in check:
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return f"{probe}: {value!r} is not numeric"
+        if 'min' in check and number < check['min']:
+            return f"{probe}: {number:g} < {check['min']}"
+        if 'max' in check and number > check['max']:
+            return f"{probe}: {number:g} > {check['max']}"
+    return None
+
+def run_plan(page, plan, output_dir=OUTPUT_DIR):
+    """
+    Snaps on a pre-snap page and executes the plan's steps in order
+    """
+    print(f"\n🏈 {plan['name']}" + (f" — {plan['description']}" if plan['description'] else ""))
+    snap_at = page.evaluate(SNAP_SCRIPT, plan['events'])
+
+    results = []
+    failures = []
+    current_phase = None
+    for step in plan['steps']:
+        observed = page.evaluate(STEP_SCRIPT, {
+            'snapAt': snap_at, 'at': step['at'], 'probes': step['probes'], 'dispatch': step['dispatch'],
+        })
+        if step['phase'] and step['phase'] != current_phase:
+            current_phase = step['phase']
+            print(f"   🔄 {current_phase}")
+
+        screenshot = None
+        if step['capture']:
+            screenshot = os.path.join(output_dir, f"{plan['screenshot_prefix']}-{step['at']:g}s.png")
+            page.screenshot(path=screenshot)
+
+        step_failures = []
+        for check in step['asserts']:
+            message = check_assertion(check, observed['values'].get(check['probe']))
+            if message:
+                step_failures.append(f"{step['at']:g}s {message}")
+        failures.extend(step_failures)
+
+        label = ", ".join(step['labels'])
+        values = " ".join(f"{k}={v}" for k, v in observed['values'].items())
+        status = "❌" if step_failures else "📸" if screenshot else "✅"
+        print(f"   {status} {step['at']:g}s (actual {observed['t']:.2f}s) {label} {values}".rstrip())
+        for message in step_failures:
+            print(f"      ⚠️ {message}")
+
+        results.append({'at': step['at'], 'actual': observed['t'], 'phase': step['phase'],
+                         'values': observed['values'], 'screenshot': screenshot, 'failures': step_failures})
+
+    return {'name': plan['name'], 'steps': results, 'failures': failures, 'passed': not failures}
+
+def setup_url(base_url, setup):
+    query = setup.get('query') or {}
+    return f"{base_url.rstrip('/')}/?{urlencode(query)}" if query else base_url
+
+def run_scenarios(playwright, specs, base_url=None, governor=None):
+    """
+    Runs specs grouped by setup: each group warms one pooled page and reuses it via hard-reset
+    (a scenario that dispatched events gets a fresh page instead).
+    The browser is launched through the resource governor, which recycles it between
+    scenarios once it runs too many or grows past its memory limit.
+    """
+    base_url = base_url or get_app_url()
+    governor = governor or ResourceGovernor()
+    plans = [build_plan(spec) for spec in specs]
+    groups = {}
+    for plan in plans:
+        groups.setdefault(plan['setup_key'], []).append(plan)
+
+    print(f"🗂️ {len(plans)} scenarios in {len(groups)} setup groups")
+    reports = []
+    managed = governor.launch(playwright)
+    try:
+        for group in groups.values():
+            setup = group[0]['setup']
+            pool = None
+            try:
+                for plan in group:
+                    if pool is None:
+                        pool = PagePool(managed.browser, size=1, url=setup_url(base_url, setup),
+                                        pocket_envelope=setup['pocket_envelope'], fullscreen=setup['fullscreen'])
+                    try:
+                        with pool.page(reuse=plan['reuse_page']) as page:
+                            reports.append(run_plan(page, plan))
+                    except Exception as e:
+                        print(f"❌ {plan['name']} failed: {e}")
+                        reports.append({'name': plan['name'], 'steps': [], 'failures': [str(e)], 'passed': False})
+
+                    recycled = governor.checkin(managed, playwright)
+                    if recycled is not managed:
+                        # The pooled page died with the old browser; warm a new one on demand
+                        pool.close()
+                        pool = None
+                        managed = recycled
+            finally:
+                if pool:
+                    pool.close()
+    finally:
+        governor.close(managed)
+    return reports
+
+def main():
+    specs = load_specs(sys.argv[1:] or None)
+    if not specs:
+        print(f"❌ No scenario specs found in {SCENARIOS_DIR}")
+        sys.exit(1)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    from playwright.sync_api import sync_playwright
+    with sync_playwright() as p:
+        governor = ResourceGovernor()
+        try:
+            reports = run_scenarios(p, specs, governor=governor)
+        finally:
+            governor.cleanup_orphans()
+            print("🧹 Browser cleanup completed")
+
+    print("\n📋 Summary")
+    for report in reports:
+        print(f"   {'✅' if report['passed'] else '❌'} {report['name']} ({len(report['failures'])} failures)")
+    sys.exit(0 if all(report['passed'] for report in reports) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Cold-Start and Hydration Budget Checker for the Football Panel
+Loads the page fresh, records startup metrics and compares them to scripts/startup_budgets.json
+
+    python scripts/startup_budget.py                     # check against budgets, append to history
+    python scripts/startup_budget.py --runs 5 --cpu 6    # slower "weak hardware" profile
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+from statistics import median
+from playwright.sync_api import sync_playwright
+from playwright_config import get_app_url, get_launch_options, get_context_config, get_page_config
+from page_pool import wait_for_app, open_coach_panel, FIELD_SELECTOR
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BUDGETS_PATH = os.path.join(SCRIPTS_DIR, 'startup_budgets.json')
+HISTORY_PATH = os.path.join(SCRIPTS_DIR, 'startup_history.jsonl')
+
+# Installed before any page script runs; collects LCP, long tasks, hydration and panel timing
+STARTUP_OBSERVER_SCRIPT = """
+(() => {
+    const s = window.__startup = { lcp: 0, longTasks: [], hydratedAt: null, panelClickAt: null, simulatorReadyAt: null };
+    try {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) s.lcp = Math.max(s.lcp, entry.startTime);
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) s.longTasks.push({ start: entry.startTime, duration: entry.duration });
+        }).observe({ type: 'longtask', buffered: true });
+    } catch (e) {}
+
+    // React attaches __reactFiber$/__reactProps$ keys to DOM nodes once it hydrates them
+    const tile = () => document.querySelector("button[aria-controls='football-panel']");
+    const hydrationPoll = setInterval(() => {
+        const el = tile();
+        if (el && Object.keys(el).some(k => k.startsWith('__reactProps$'))) {
+            s.hydratedAt = performance.now();
+            clearInterval(hydrationPoll);
+        }
+    }, 10);
+
+    document.addEventListener('click', (e) => {
+        if (s.panelClickAt === null && e.target.closest && e.target.closest("button[aria-controls='football-panel']")) {
+            s.panelClickAt = performance.now();
+        }
+    }, true);
+
+    // PlaySimulator renders its field SVG whether or not it is fullscreen
+    const fieldVisible = () => {
+        const field = document.querySelector("svg[data-testid='field-root']");
+        return !!field && field.getClientRects().length > 0;
+    };
+    new MutationObserver((_, observer) => {
+        if (s.panelClickAt !== null && s.simulatorReadyAt === null && fieldVisible()) {
+            s.simulatorReadyAt = performance.now();
+            observer.disconnect();
+        }
+    }).observe(document, { childList: true, subtree: true });
+})();
+"""
+
+COLLECT_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0] || {};
+    const scripts = performance.getEntriesByType('resource')
+        .filter(r => r.initiatorType === 'script' || r.name.endsWith('.js'))
+        .map(r => ({ url: r.name, transferSize: r.transferSize, decodedSize: r.decodedBodySize }));
+    return {
+        startup: window.__startup,
+        nav: {
+            ttfb: nav.responseStart || 0,
+            domContentLoaded: nav.domContentLoadedEventEnd || 0,
+            load: nav.loadEventEnd || 0,
+        },
+        scripts,
+    };
+}
+"""
+
+HASH_SUFFIX = re.compile(r'[-.][0-9a-f]{8,}(?=\.js$)')
+
+def chunk_name(url):
+    """
+    Maps a Next.js script URL to a stable chunk name (content hash stripped)
+    e.g. /_next/static/chunks/app/page-1a2b3c4d5e6f.js -> app/page
+    """
+    path = url.split('?')[0]
+    marker = '/_next/static/chunks/'
+    if marker in path:
+        path = path.split(marker, 1)[1]
+    else:
+        path = path.rsplit('/', 1)[-1]
+    return HASH_SUFFIX.sub('', path)[:-3] if path.endswith('.js') else path
+
+def load_budgets(path=BUDGETS_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+def measure_cold_start(browser, url, cpu_throttle=1):
+    """
+    One fresh-context load: page load, hydration, opening the Football panel
+    """
+    context = browser.new_context(**get_context_config())
+    try:
+        context.add_init_script(STARTUP_OBSERVER_SCRIPT)
+        page = context.new_page()
+        page_config = get_page_config()
+        page.set_default_timeout(page_config['default_timeout'])
+        page.set_default_navigation_timeout(page_config['navigation_timeout'])
+
+        cdp = context.new_cdp_session(page)
+        cdp.send('Network.enable')
+        cdp.send('Network.setCacheDisabled', {'cacheDisabled': True})
+        if cpu_throttle > 1:
+            cdp.send('Emulation.setCPUThrottlingRate', {'rate': cpu_throttle})
+
+        page.goto(url)
+        wait_for_app(page)
+        page.wait_for_function("() => window.__startup && window.__startup.hydratedAt !== null", timeout=60000)
+        open_coach_panel(page)
+        page.locator(FIELD_SELECTOR).first.wait_for(state='visible', timeout=60000)
+        page.wait_for_function("() => window.__startup.simulatorReadyAt !== null", timeout=10000)
+        page.wait_for_timeout(500)  # let trailing long tasks from the mount land
+
+        data = page.evaluate(COLLECT_SCRIPT)
+    finally:
+        context.close()
+
+    startup = data['startup']
+    ready_at = startup['simulatorReadyAt']
+    load_tasks = [t for t in startup['longTasks'] if t['start'] <= ready_at]
+    chunks = {}
+    for script in data['scripts']:
+        name = chunk_name(script['url'])
+        chunks[name] = chunks.get(name, 0) + script['transferSize'] / 1024
+
+    return {
+        'ttfb_ms': data['nav']['ttfb'],
+        'dom_content_loaded_ms': data['nav']['domContentLoaded'],
+        'load_ms': data['nav']['load'],
+        'lcp_ms': startup['lcp'],
+        'app_hydrated_ms': startup['hydratedAt'],
+        'simulator_ready_ms': ready_at - startup['panelClickAt'],
+        'long_tasks': len(load_tasks),
+        'total_blocking_time_ms': sum(max(0, t['duration'] - 50) for t in load_tasks),
+        'js_total_kb': sum(chunks.values()),
+        'chunks_kb': chunks,
+    }
+
+def summarize(runs):
+    """
+    Median of each metric across runs (chunks by name)
+    """
+    summary = {}
+    for metric in runs[0]:
+        if metric == 'chunks_kb':
+            continue
+        summary[metric] = median(run[metric] for run in runs)
+    names = set().union(*(run['chunks_kb'] for run in runs))
+    summary['chunks_kb'] = {name: median(run['chunks_kb'].get(name, 0) for run in runs) for name in sorted(names)}
+    return summary
+
+def check_budgets(summary, budgets):
+    """
+    Returns a list of (metric, value, budget) for every exceeded budget
+    """
+    over = []
+    for metric, budget in budgets.get('budgets', {}).items():
+        value = summary.get(metric)
+        if value is not None and value > budget:
+            over.append((metric, value, budget))
+    for name, budget in budgets.get('chunk_budgets_kb', {}).items():
+        value = summary['chunks_kb'].get(name)
+        if value is not None and value > budget:
+            over.append((f"chunk {name}", value, budget))
+    return over
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=SCRIPTS_DIR).stdout.strip() or None
+    except Exception:
+        return None
+
+def read_history(path=HISTORY_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def append_history(entry, path=HISTORY_PATH):
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+
+def print_report(summary, budgets, over, previous):
+    limits = budgets.get('budgets', {})
+    print("\n⏱️ Football Panel Cold Start")
+    print("=" * 64)
+    print(f"  {'metric':<26}{'value':>10}{'budget':>10}{'prev':>10}")
+    for metric, value in summary.items():
+        if metric == 'chunks_kb':
+            continue
+        budget = limits.get(metric)
+        prev = previous['summary'].get(metric) if previous else None
+        flag = " ❌" if budget is not None and value > budget else ""
+        budget_str = str(budget) if budget is not None else '-'
+        prev_str = f"{prev:.0f}" if prev is not None else '-'
+        print(f"  {metric:<26}{value:>10.0f}{budget_str:>10}{prev_str:>10}{flag}")
+
+    chunk_limits = budgets.get('chunk_budgets_kb', {})
+    print("\n📦 JS transferred per chunk (KB)")
+    for name, kb in sorted(summary['chunks_kb'].items(), key=lambda item: -item[1]):
+        budget = chunk_limits.get(name)
+        flag = " ❌" if budget is not None and kb > budget else ""
+        suffix = f" / {budget}" if budget is not None else ""
+        print(f"  {name:<48}{kb:>8.1f}{suffix}{flag}")
+
+    print()
+    if over:
+        print("❌ Over budget:")
+        for metric, value, budget in over:
+            print(f"   - {metric}: {value:.0f} > {budget}")
+    else:
+        print("✅ All startup budgets met")
+
+def main():
+    budgets = load_budgets()
+    parser = argparse.ArgumentParser(description="Check Football panel cold-start budgets")
+    parser.add_argument('--url', default=get_app_url() + budgets.get('path', '/'))
+    parser.add_argument('--runs', type=int, default=budgets.get('runs', 3))
+    parser.add_argument('--cpu', type=float, default=budgets.get('cpu_throttle', 4),
+                        help="CPU slowdown factor to emulate weak hardware (1 = none)")
+    parser.add_argument('--headless', action='store_true')
+    parser.add_argument('--no-history', action='store_true', help="Don't append this run to the history file")
+    args = parser.parse_args()
+
+    with sync_playwright() as p:
+        launch_options = get_launch_options()
+        if args.headless:
+            launch_options['headless'] = True
+        browser = p.chromium.launch(**launch_options)
+        try:
+            runs = []
+            for i in range(args.runs):
+                run = measure_cold_start(browser, args.url, args.cpu)
+                runs.append(run)
+                print(f"🧊 Run {i + 1}/{args.runs}: LCP {run['lcp_ms']:.0f}ms, hydrated {run['app_hydrated_ms']:.0f}ms, "
+                      f"simulator {run['simulator_ready_ms']:.0f}ms, JS {run['js_total_kb']:.0f}KB")
+        finally:
+            browser.close()
+
+    summary = summarize(runs)
+    over = check_budgets(summary, budgets)
+    history = read_history()
+    # Only compare against runs taken under the same URL and CPU profile
+    comparable = [h for h in history if h.get('url') == args.url and h.get('cpu_throttle') == args.cpu]
+    print_report(summary, budgets, over, comparable[-1] if comparable else None)
+
+    if not args.no_history:
+        append_history({
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'revision': git_revision(),
+            'url': args.url,
+            'runs': args.runs,
+            'cpu_throttle': args.cpu,
+            'passed': not over,
+            'summary': summary,
+        })
+        print(f"💾 History updated: {os.path.relpath(HISTORY_PATH)} ({len(history) + 1} entries)")
+
+    sys.exit(1 if over else 0)
+
+if __name__ == "__main__":
+    main()
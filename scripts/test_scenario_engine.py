@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the scenario engine's plan building and assertions (no browser needed)
+
+    python -m pytest scripts/test_scenario_engine.py
+"""
+
+import os
+import pytest
+from scenario_engine import SCENARIOS_DIR, load_spec, load_specs, build_plan, phase_at, check_assertion
+
+def spec_path(name):
+    return os.path.join(SCENARIOS_DIR, name)
+
+def steps_by_time(plan):
+    return {step['at']: step for step in plan['steps']}
+
+def test_checked_in_specs_build():
+    specs = load_specs()
+    assert {spec['name'] for spec in specs} == {'ol-dl-focused', 'ol-dl-mechanics', 'ol-dl-mechanics-with-pocket'}
+    for spec in specs:
+        plan = build_plan(spec)
+        times = [step['at'] for step in plan['steps']]
+        assert times == sorted(set(round(float(entry['at']), 3) for entry in spec['timeline']))
+        assert plan['reuse_page']
+
+def test_probes_merge_per_timestamp():
+    plan = build_plan(load_spec(spec_path('ol_dl_focused.json')))
+    step = steps_by_time(plan)[0.5]
+    # Listed probes and asserted probes share one round trip
+    assert [probe['id'] for probe in step['probes']] == ['de_l', 'de_r', 'pocket', 'sacked']
+    assert step['probes'][0] == {'kind': 'position', 'selector': 'svg text', 'label': 'DEL', 'id': 'de_l'}
+    assert len(step['asserts']) == 2
+
+def test_duplicate_timestamps_merge():
+    spec = {
+        'name': 'merge',
+        'probes': {'a': {'kind': 'count', 'selector': 'svg'}, 'b': {'kind': 'count', 'selector': 'g'}},
+        'timeline': [
+            {'at': 1, 'label': 'first', 'probes': ['a']},
+            {'at': 1.0, 'label': 'second', 'capture': True, 'assert': [{'probe': 'b', 'min': 1}],
+             'dispatch': [{'event': 'throw-to-receiver', 'detail': {'rid': 'X'}}]},
+        ],
+    }
+    plan = build_plan(spec)
+    assert len(plan['steps']) == 1
+    step = plan['steps'][0]
+    assert step['labels'] == ['first', 'second']
+    assert step['capture']
+    assert [probe['id'] for probe in step['probes']] == ['a', 'b']
+    assert not plan['reuse_page']
+
+def test_phase_boundaries_are_half_open():
+    plan = build_plan(load_spec(spec_path('ol_dl_mechanics_with_pocket.json')))
+    phases = {at: step['phase'] for at, step in steps_by_time(plan).items()}
+    assert phases[0.5].startswith('PHASE 1')
+    assert phases[3.0].startswith('PHASE 3')
+    assert phases[4.0].startswith('POCKET COLLAPSE')
+
+    focused = steps_by_time(build_plan(load_spec(spec_path('ol_dl_focused.json'))))
+    assert focused[2.7]['phase'].startswith('Phase 3')
+
+def test_phase_at_outside_windows():
+    phases = [{'name': 'early', 'from': 0.5, 'to': 1.0}]
+    assert phase_at(phases, 0.2) is None
+    assert phase_at(phases, 1.0) is None
+
+def test_unknown_probe_in_timeline():
+    spec = {'name': 'bad', 'probes': {}, 'timeline': [{'at': 1, 'probes': ['pocket']}]}
+    with pytest.raises(ValueError, match="unknown probes"):
+        build_plan(spec)
+
+def test_unknown_probe_in_assertion():
+    spec = {'name': 'bad', 'probes': {}, 'timeline': [{'at': 1, 'assert': [{'probe': 'pocket', 'truthy': True}]}]}
+    with pytest.raises(ValueError, match="unknown probe 'pocket'"):
+        build_plan(spec)
+
+def test_unknown_probe_kind():
+    spec = {'name': 'bad', 'probes': {'pocket': {'kind': 'html'}}, 'timeline': []}
+    with pytest.raises(ValueError, match="unknown kind"):
+        build_plan(spec)
+
+def test_match_with_bounds():
+    check = {'probe': 'pocket', 'match': r'(\d+)%', 'min': 0, 'max': 100}
+    assert check_assertion(check, 'Pocket: 85%') is None
+    assert 'does not match' in check_assertion(check, 'Pocket: --')
+    assert 'does not match' in check_assertion(check, None)
+    assert '> 100' in check_assertion(check, 'Pocket: 120%')
+
+def test_min_max_numbers():
+    assert check_assertion({'probe': 'n', 'min': 2}, 1) == 'n: 1 < 2'
+    assert check_assertion({'probe': 'n', 'max': 2}, 3) == 'n: 3 > 2'
+    assert check_assertion({'probe': 'n', 'min': 2, 'max': 4}, 3) is None
+    assert 'not numeric' in check_assertion({'probe': 'n', 'min': 0}, 'abc')
+
+def test_falsy():
+    check = {'probe': 'sacked', 'falsy': True}
+    assert check_assertion(check, False) is None
+    assert 'is not falsy' in check_assertion(check, True)
+
+def test_probe_error_fails():
+    message = check_assertion({'probe': 'x', 'truthy': True}, {'error': 'TypeError'})
+    assert message == 'x: probe error TypeError'